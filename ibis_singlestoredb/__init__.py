@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 
 __version__ = '0.4.3'
 
+_select_re = re.compile(r'^\s*SELECT\s', flags=re.MULTILINE | re.IGNORECASE)
+
 
 class Backend(BaseAlchemyBackend, CanCreateDatabase):
     name = 'singlestoredb'
@@ -54,7 +56,7 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
 
         driver = params.pop('driver', None)
         if driver and not driver.startswith('singlestoredb+'):
-            driver = 'singlestoredb+{}'.format(driver)
+            driver = f'singlestoredb+{driver}'
 
         alchemy_url = self._build_alchemy_url(
             url=params.pop('url', None),
@@ -117,10 +119,7 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
         return self._filter_with_like(databases, like)
 
     def _metadata(self, query: str) -> Iterable[tuple[str, dt.DataType]]:
-        if (
-            re.search(r'^\s*SELECT\s', query, flags=re.MULTILINE | re.IGNORECASE)
-            is not None
-        ):
+        if _select_re.search(query) is not None:
             query = f'({query})'
 
         with self.begin() as con:
@@ -147,24 +146,25 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
         name: str,
         definition: sa.sql.compiler.Compiled,
     ) -> Generator[str, Any, Any]:
+        # `name` has already been quoted by `_create_temp_view`.
         # There is no REPLACE VIEW, so we have to work around it.
         if name in Backend._view_names:
-            yield f'ALTER VIEW `{name}` AS {definition}'
+            yield f'ALTER VIEW {name} AS {definition}'
         else:
             Backend._view_names.add(name)
-            yield f'CREATE VIEW `{name}` AS {definition}'
+            yield f'CREATE VIEW {name} AS {definition}'
 
     def create_database(self, name: str, force: bool = False) -> None:
         name = self._quote(name)
         if_exists = 'IF NOT EXISTS ' * force
         with self.begin() as con:
-            con.exec_driver_sql(f'CREATE DATABASE {if_exists}`{name}`')
+            con.exec_driver_sql(f'CREATE DATABASE {if_exists}{name}')
 
     def drop_database(self, name: str, force: bool = False) -> None:
         name = self._quote(name)
         if_exists = 'IF EXISTS ' * force
         with self.begin() as con:
-            con.exec_driver_sql(f'DROP DATABASE {if_exists}`{name}`')
+            con.exec_driver_sql(f'DROP DATABASE {if_exists}{name}')
 
     @property
     def show(self) -> Any:
@@ -324,18 +324,27 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
             if storage_type == 'COLUMNSTORE':
                 storage_type = None
 
-        if database == self.current_database:
+        if obj is None and schema is None:
+            raise ValueError('You must pass either an expression or a schema')
+
+        if obj is not None and not isinstance(obj, (pd.DataFrame, ir.TableExpr)):
+            raise TypeError(
+                '`obj` must be a DataFrame or table expression, '
+                f'not {type(obj).__name__}',
+            )
+
+        # Look this up once; each access is a server round trip
+        current_database = self.current_database
+
+        if database == current_database:
             # avoid fully qualified name
             database = None
 
         if database is not None:
             raise NotImplementedError(
-                'Creating tables from a different database is not yet ' 'implemented',
+                'Creating tables from a different database is not yet implemented',
             )
 
-        if obj is None and schema is None:
-            raise ValueError('You must pass either an expression or a schema')
-
         drop = False
         if name.lower() in [x.lower() for x in self.list_tables()]:
             if overwrite:
@@ -384,7 +393,7 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
             t = self._table_from_schema(
                 name,
                 schema,
-                database=database or self.current_database,
+                database=database or current_database,
                 storage_type=storage_type,
                 temp=temp,
             )
@@ -404,7 +413,7 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
                     if_exists='append',
                 )
 
-        elif isinstance(obj, ir.TableExpr) or schema is not None:
+        else:
             if obj is not None and schema is not None:
                 if not sorted(obj.schema().names) == sorted(sch.schema(schema).names):
                     raise TypeError(
@@ -423,7 +432,7 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
             t = self._table_from_schema(
                 name,
                 schema,
-                database=database or self.current_database,
+                database=database or current_database,
                 storage_type=storage_type,
                 temp=temp,
             )
@@ -441,14 +450,6 @@ class Backend(BaseAlchemyBackend, CanCreateDatabase):
                         t.insert().from_select(list(obj.columns), obj.compile()),
                     )
 
-        else:
-            raise TypeError(
-                '`obj` and/or `schema` are not an expected type: {} / {}'.format(
-                    type(obj).__name__,
-                    type(schema).__name__,
-                ),
-            )
-
         return self.table(name)
 
     def database(self, name: str | None = None) -> Database:
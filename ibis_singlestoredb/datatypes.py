@@ -68,7 +68,8 @@ def _type_from_cursor_info(descr: Tuple[Any, ...], field: Any) -> dt.DataType:
         typ = dt.Array(dt.string)
 
     elif flags.is_unsigned and type_code in _num_types:
-        typ = getattr(dt, f'U{_type_mapping[typename].__name__}')
+        typ = _type_mapping[typename]
+        typ = _unsigned_int_map.get(typ, typ)
 
     elif type_code in _char_types:
         # binary text
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
 import re
+import string
 import warnings
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -24,6 +27,66 @@ class Table(dt.DataType):
     """Placeholder for Table types until Ibis supports them."""
 
 
+# Expression types that get a method for UDFs whose first input is the given type
+_method_targets = (
+    (dt.String, types.StringValue),
+    (dt.Integer, types.IntegerValue),
+    (dt.Floating, types.FloatingValue),
+)
+
+# Column modifiers that may follow a data type, matched in one pass
+_modifier_re = re.compile(
+    r'(?:CHARACTER\s+SET\s+(?P<character_set>\S+)|COLLATE\s+(?P<collate>\S+)|'
+    r'(?P<not_null>NOT\s+NULL)|NULL)\s*',
+    flags=re.I,
+)
+
+# Names given to parameters that are not named in the prototype
+_param_names = string.ascii_letters
+
+_type_map = {
+    'bool': dt.Boolean,
+    'bit': dt.Binary,
+    'tinyint': dt.Int8,
+    'smallint': dt.Int16,
+    'mediumint': dt.Int32,
+    'int': dt.Int32,
+    'bigint': dt.Int64,
+    'float': dt.Float32,
+    'double': dt.Float64,
+    'tinyint unsigned': dt.UInt8,
+    'smallint unsigned': dt.UInt16,
+    'mediumint unsigned': dt.UInt32,
+    'int unsigned': dt.UInt32,
+    'bignt unsigned': dt.UInt64,
+    'decimal': dt.Decimal,
+    'date': dt.Date,
+    'time': dt.Interval,
+    'datetime': dt.Timestamp,
+    'timestamp': dt.Timestamp,
+    'year': dt.Int16,
+    'char': dt.String,
+    'varchar': dt.String,
+    'text': dt.String,
+    'tinytext': dt.String,
+    'mediumtext': dt.String,
+    'longtext': dt.String,
+    'binary': dt.Binary,
+    'varbinary': dt.Binary,
+    'blob': dt.Binary,
+    'tinyblob': dt.Binary,
+    'mediumblob': dt.Binary,
+    'longblob': dt.Binary,
+    'json': dt.JSON,
+    'record': dt.Struct,
+    'geograph': dt.Geography,
+    'geographypoint': dt.Point,
+    'table': Table,
+    'null': dt.Null,
+    'array': dt.Array,
+}
+
+
 def _build_data_type(
     dtype: str,
     info: Dict[str, Any],
@@ -49,48 +112,6 @@ def _build_data_type(
     dt.DataType
 
     """
-    type_map = {
-        'bool': dt.Boolean,
-        'bit': dt.Binary,
-        'tinyint': dt.Int8,
-        'smallint': dt.Int16,
-        'mediumint': dt.Int32,
-        'int': dt.Int32,
-        'bigint': dt.Int64,
-        'float': dt.Float32,
-        'double': dt.Float64,
-        'tinyint unsigned': dt.UInt8,
-        'smallint unsigned': dt.UInt16,
-        'mediumint unsigned': dt.UInt32,
-        'int unsigned': dt.UInt32,
-        'bignt unsigned': dt.UInt64,
-        'decimal': dt.Decimal,
-        'date': dt.Date,
-        'time': dt.Interval,
-        'datetime': dt.Timestamp,
-        'timestamp': dt.Timestamp,
-        'year': dt.Int16,
-        'char': dt.String,
-        'varchar': dt.String,
-        'text': dt.String,
-        'tinytext': dt.String,
-        'mediumtext': dt.String,
-        'longtext': dt.String,
-        'binary': dt.Binary,
-        'varbinary': dt.Binary,
-        'blob': dt.Binary,
-        'tinyblob': dt.Binary,
-        'mediumblob': dt.Binary,
-        'longblob': dt.Binary,
-        'json': dt.JSON,
-        'record': dt.Struct,
-        'geograph': dt.Geography,
-        'geographypoint': dt.Point,
-        'table': Table,
-        'null': dt.Null,
-        'array': dt.Array,
-    }
-
     attrs: Dict[str, Any] = {}
 
     if args and 'decimal' in dtype:
@@ -114,13 +135,17 @@ def _build_data_type(
 
     attrs['nullable'] = info.get('nullable', False)
 
-    return type_map[dtype](**attrs)
+    return _type_map[dtype](**attrs)
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_data_type(data: str) -> Tuple[dt.DataType, str]:
     """
     Parse data type from string.
 
+    Results are cached since the same prototypes get parsed again
+    each time the functions are synchronized with the server.
+
     Parameters
     ----------
     data : str
@@ -153,38 +178,15 @@ def _parse_data_type(data: str) -> Tuple[dt.DataType, str]:
         args, data = re.split(r'\s*\)\s*', data, flags=re.I, maxsplit=1)
         data_type_args = [int(x) for x in re.split(r'\s*,\s*', args)]
 
-    modifiers = {}
-    while data and re.match(
-        r'^(CHARACTER\s+SET\s+|COLLATE\s+|NULL|NOT\s+NULL)',
-        data,
-        flags=re.I,
-    ):
-        if re.match(r'CHARACTER\s+SET\s+', data, flags=re.I):
-            _, modifiers['character_set'], data = re.split(
-                r'CHARACTER\s+SET\s+(\S+)\s*',
-                data,
-                flags=re.I,
-                maxsplit=1,
-            )
-        elif re.match(r'COLLATE\s+', data, flags=re.I):
-            _, modifiers['collate'], data = re.split(
-                r'COLLATE\s+(\S+)\s*',
-                data,
-                flags=re.I,
-                maxsplit=1,
-            )
-        elif re.match(r'NULL', data, flags=re.I):
-            _, data = re.split(r'NULL\s*', data, flags=re.I, maxsplit=1)
-            modifiers['nullable'] = True
-        elif re.match(r'NOT\s+NULL', data, flags=re.I):
-            _, data = re.split(r'NOT\s+NULL\s*', data, flags=re.I, maxsplit=1)
-            modifiers['nullable'] = False
+    modifiers: Dict[str, Any] = {}
+    while m := _modifier_re.match(data):
+        if m.group('character_set'):
+            modifiers['character_set'] = m.group('character_set')
+        elif m.group('collate'):
+            modifiers['collate'] = m.group('collate')
         else:
-            unknown, data = re.split(r'(\S+)', data, flags=re.I, maxsplit=1)
-            warnings.warn(
-                f'Skipping unknown CREATE FUNCTION syntax: {unknown}',
-                RuntimeWarning,
-            )
+            modifiers['nullable'] = not m.group('not_null')
+        data = data[m.end():]
 
     return _build_data_type(data_type, modifiers, data_type_args, schema), data
 
@@ -208,7 +210,7 @@ def _parse_params(
 
     """
     out = []
-    i = ord('a')
+    i = 0
     while params and not params.startswith(')'):
         if parse_names:
             _, param_name, params = re.split(
@@ -218,7 +220,12 @@ def _parse_params(
             if param_name.startswith('`') and param_name.endswith('`'):
                 param_name = param_name[1:-1]
         else:
-            param_name = chr(i)
+            if i >= len(_param_names):
+                raise ValueError(
+                    f'Too many unnamed parameters; at most {len(_param_names)} '
+                    'are supported.',
+                )
+            param_name = _param_names[i]
             i += 1
             params = params.lstrip()
 
@@ -320,8 +327,11 @@ def build_function(conn: Any, name: str) -> Optional[Callable[..., Any]]:
 
     try:
         func_type, func_name, inputs, output, info = _parse_create_function(proto)
-    except Exception:
-        print(f'Failed to parse: {proto}')
+    except Exception as exc:
+        warnings.warn(
+            f'Could not create function `{name}`. Failed to parse: {proto} ({exc})',
+            RuntimeWarning,
+        )
         return None
 
     return _make_udf(func_name, func_type, inputs, output, info)
@@ -359,25 +369,25 @@ def _make_func_doc(
     info = info or {}
     code = info.get('code', '')
     format = info.get('format', '')
-    doc = [f'Call `{name}` {ftype} function.', '']
-    if ftype == 'remote service':
-        doc.append(f'Accesses remote service at {code} using {format} format.')
-        doc.append('')
-    doc.extend(['Parameters', '----------'])
-    for name, dtype in inputs:
-        arg = f'{name} : {dtype}'
-        if dtype.nullable:
-            arg += ' or None'
-        doc.append(arg)
-    if output is not None:
-        doc.append('')
-        doc.extend(['Returns', '-------'])
-        ret = str(output)
-        if output.nullable:
-            ret += ' or None'
-        doc.append(ret)
-    doc.append('')
-    return '\n'.join(doc)
+
+    def _lines() -> Iterator[str]:
+        yield f'Call `{name}` {ftype} function.'
+        yield ''
+        if ftype == 'remote service':
+            yield f'Accesses remote service at {code} using {format} format.'
+            yield ''
+        yield 'Parameters'
+        yield '----------'
+        for arg, dtype in inputs:
+            yield f'{arg} : {dtype} or None' if dtype.nullable else f'{arg} : {dtype}'
+        if output is not None:
+            yield ''
+            yield 'Returns'
+            yield '-------'
+            yield f'{output} or None' if output.nullable else str(output)
+        yield ''
+
+    return '\n'.join(_lines())
 
 
 def _make_udf(
@@ -421,15 +431,13 @@ def _make_udf(
 
     # TODO: Check for existing function
     if inputs:
-        if isinstance(inputs[0][1], dt.String):
-            setattr(types.StringValue, name, eval_func)
-        elif isinstance(inputs[0][1], dt.Integer):
-            setattr(types.IntegerValue, name, eval_func)
-        elif isinstance(inputs[0][1], dt.Floating):
-            setattr(types.FloatingValue, name, eval_func)
+        for dtype, value_type in _method_targets:
+            if isinstance(inputs[0][1], dtype):
+                setattr(value_type, name, eval_func)
+                break
 
     @ibis.singlestoredb.add_operation(func_type)
     def _eval_func(t: tr.ExprTranslator, op: ops.ValueOp) -> types.Expr:
-        return getattr(sa.func, name)(*[t.translate(x) for x in op.args])
+        return getattr(sa.func, name)(*map(t.translate, op.args))
 
     return eval_func
@@ -48,6 +48,8 @@ SINGLESTOREDB_TYPES = [
     ('int4 unsigned', dt.uint32),
     ('float', dt.float32),
     ('double', dt.float64),
+    ('float unsigned', dt.float32),
+    ('double unsigned', dt.float64),
     ('decimal(10, 0)', dt.Decimal(10, 0)),
     ('decimal(5, 2)', dt.Decimal(5, 2)),
     ('dec', dt.Decimal(10, 0)),
@@ -137,6 +139,39 @@ def test_blob_type(con: Any, coltype: str) -> None:
         con.drop_table(tmp, force=True)
 
 
+def test_create_drop_database_quoted_name(con: Any) -> None:
+    # Mixed-case names get backtick-quoted by the dialect
+    name = f'Tmp_Db_{ibis.util.guid()}'
+
+    try:
+        con.create_database(name)
+        assert name in con.list_databases()
+        con.drop_database(name)
+        assert name not in con.list_databases()
+
+    finally:
+        con.drop_database(name, force=True)
+
+
+def test_temp_view_quoted_name(con: Any) -> None:
+    # Mixed-case names get backtick-quoted by the dialect
+    guid = ibis.util.guid()
+    tmp = f'Tmp_Table_{guid}'
+    view_name = f'Tmp_View_{guid}'
+
+    try:
+        with con.begin() as c:
+            c.exec_driver_sql(f'CREATE ROWSTORE TABLE `{tmp}` (x INT)')
+            c.exec_driver_sql(f'INSERT INTO `{tmp}` VALUES (1), (2), (3)')
+        view = con.table(tmp).alias(view_name)
+        assert view.x.sum().execute() == 6
+
+    finally:
+        with con.begin() as c:
+            c.exec_driver_sql(f'DROP VIEW IF EXISTS `{view_name}`')
+        con.drop_table(tmp, force=True)
+
+
 @pytest.fixture(scope='session')
 def tmp_t(con_nodb: Any) -> Generator[Any, Any, Any]:
     pid = os.getpid()
@@ -3,10 +3,12 @@ from __future__ import annotations
 from typing import Any
 
 import ibis
+import ibis.expr.datatypes as dt
 import numpy as np
 import pandas as pd
 import pandas.testing as tm
 import pytest
+from ibis_singlestoredb.functions.user import _parse_create_function
 
 ROW_IDS = [21, 25, 31]
 FLOAT_VECTORS = [
@@ -43,6 +45,23 @@ OBJECTS = [
 ]
 
 
+def test_parse_create_function_unnamed_params() -> None:
+    params = ', '.join(['bigint NOT NULL'] * 30)
+    func_type, name, inputs, output, _ = _parse_create_function(
+        f'CREATE AGGREGATE `agg_30`({params}) RETURNS bigint NOT NULL',
+    )
+    assert func_type == 'aggregate'
+    assert name == 'agg_30'
+    assert [x[0] for x in inputs] == list('abcdefghijklmnopqrstuvwxyzABCD')
+    assert all(x[1] == dt.Int64(nullable=False) for x in inputs)
+
+    params = ', '.join(['bigint NOT NULL'] * 53)
+    with pytest.raises(ValueError, match='Too many unnamed parameters'):
+        _parse_create_function(
+            f'CREATE AGGREGATE `agg_53`({params}) RETURNS bigint NOT NULL',
+        )
+
+
 def make_vectors(tbl: Any) -> Any:
     return tbl.mutate(
         vec1=lambda x: x.text_vector.json_array_pack(),